@@ -19,12 +19,8 @@ class AppState: ObservableObject {
     /// 显示文件选择器
     @Published var showFilePicker: Bool = false
 
-    /// 转换设置（从 UserDefaults 加载）
-    @Published var settings: ConversionSettings = ConversionSettings.load() {
-        didSet {
-            settings.save()
-        }
-    }
+    /// 转换设置（从 UserDefaults 加载，变更后延迟合并保存）
+    @Published var settings: ConversionSettings = ConversionSettings.load()
 
     /// 错误信息
     @Published var errorMessage: String?
@@ -40,7 +36,10 @@ class AppState: ObservableObject {
 
     // MARK: - Private Properties
 
-    private var lastOutputDirectory: URL?
+    /// 上次选择的输出目录：直接取自设置（随 ConversionSettings 持久化），避免两份存储不一致
+    private var lastOutputDirectory: URL? {
+        settings.outputDirectory
+    }
     private var cancellables = Set<AnyCancellable>()
     private let converter = PDFConverter()
 
@@ -48,18 +47,18 @@ class AppState: ObservableObject {
 
     init() {
         setupNotifications()
+        preloadSounds()
     }
 
     // MARK: - Public Methods
 
     /// 添加文件
     func addFiles(_ urls: [URL]) {
-        let pdfURLs = urls.filter { $0.pathExtension.lowercased() == "pdf" }
-        for url in pdfURLs {
-            if !pendingFiles.contains(url) {
-                pendingFiles.append(url)
-            }
-        }
+        // 用集合去重，并只对 pendingFiles 赋值一次，批量添加时界面只刷新一次
+        var seen = Set(pendingFiles)
+        let newFiles = urls.filter { $0.isPDF && seen.insert($0).inserted }
+        guard !newFiles.isEmpty else { return }
+        pendingFiles.append(contentsOf: newFiles)
     }
 
     /// 移除文件（按索引）
@@ -99,8 +98,7 @@ class AppState: ObservableObject {
         }
 
         if panel.runModal() == .OK, let outputURL = panel.url {
-            self.lastOutputDirectory = outputURL // 保存本次选择的目录
-            settings.outputDirectory = outputURL
+            settings.outputDirectory = outputURL // 保存本次选择的目录
 
             // 检查是否有文件将被覆盖
             let existingFiles = checkExistingFiles(outputDir: outputURL)
@@ -152,52 +150,59 @@ class AppState: ObservableObject {
 
     /// 检查将被覆盖的文件
     private func checkExistingFiles(outputDir: URL) -> [String] {
+        // 一次列出输出目录，之后按名称查集合，避免每个文件两次 stat
+        let entries = (try? FileManager.default.contentsOfDirectory(atPath: outputDir.path)) ?? []
+        guard !entries.isEmpty else { return [] }
+
+        // 仅在卷明确区分大小写时精确比较；查询失败时按不区分大小写处理，宁可多提示也不漏提示覆盖
+        let isCaseSensitive = (try? outputDir.resourceValues(forKeys: [.volumeSupportsCaseSensitiveNamesKey]))?
+            .volumeSupportsCaseSensitiveNames ?? false
+        let normalize: (String) -> String = isCaseSensitive ? { $0 } : { $0.lowercased() }
+        let existingNames = Set(entries.map(normalize))
+
+        let folderLabel = String(localized: "file.folder", bundle: .module)
         var existingFiles: [String] = []
-        let fileManager = FileManager.default
 
         for pdfURL in pendingFiles {
             let baseName = pdfURL.deletingPathExtension().lastPathComponent
 
             // 检查单页情况
-            let singlePageURL = outputDir.appendingPathComponent("\(baseName).png")
-            if fileManager.fileExists(atPath: singlePageURL.path) {
+            if existingNames.contains(normalize("\(baseName).png")) {
                 existingFiles.append("\(baseName).png")
             }
 
             // 检查多页文件夹
-            let multiPageDir = outputDir.appendingPathComponent(baseName)
-            if fileManager.fileExists(atPath: multiPageDir.path) {
-                existingFiles.append("\(baseName)/ (\(String(localized: "file.folder", bundle: .module)))")
+            if existingNames.contains(normalize(baseName)) {
+                existingFiles.append("\(baseName)/ (\(folderLabel))")
             }
         }
 
         return existingFiles
     }
 
-    /// 最大并行转换数
-    private let maxConcurrentConversions = 3
-
     /// 开始转换
     func startConversion() async {
         guard !pendingFiles.isEmpty else { return }
 
         isConverting = true
         isCancelled = false
-        tasks.removeAll()
 
-        // 创建任务
-        for url in pendingFiles {
-            let task = ConversionTask(
+        // 创建任务（整体赋值一次，列表只刷新一次）
+        tasks = pendingFiles.map { url in
+            ConversionTask(
                 id: UUID(),
                 sourceURL: url,
                 status: .pending
             )
-            tasks.append(task)
         }
+        taskIndices = Dictionary(uniqueKeysWithValues: tasks.enumerated().map { ($1.id, $0) })
 
         // 清空待转换列表（任务已创建）
         pendingFiles.removeAll()
 
+        // 本批次统一使用开始时的设置快照：子任务无需回到主线程读取，转换中途修改设置也不影响本批次
+        let settings = self.settings
+
         // 并行执行转换
         await withTaskGroup(of: Void.self) { group in
             var runningCount = 0
@@ -205,7 +210,7 @@ class AppState: ObservableObject {
 
             while taskIndex < tasks.count && !isCancelled {
                 // 控制并发数
-                while runningCount >= maxConcurrentConversions {
+                while runningCount >= PDFConverter.maxConcurrentFiles {
                     // 等待一个任务完成
                     await group.next()
                     runningCount -= 1
@@ -229,45 +234,32 @@ class AppState: ObservableObject {
                     do {
                         let result = try await self.converter.convert(
                             pdfURL: sourceURL,
-                            settings: self.settings
+                            settings: settings
                         ) { [weak self] progressInfo in
                             Task { @MainActor in
-                                guard let self = self, !self.isCancelled else { return }
-                                if let idx = self.tasks.firstIndex(where: { $0.id == taskId }) {
-                                    self.tasks[idx].status = .converting(
+                                self?.enqueueProgress(
+                                    .converting(
                                         progress: progressInfo.progress,
                                         currentPage: progressInfo.currentPage,
                                         totalPages: progressInfo.totalPages
-                                    )
-                                }
+                                    ),
+                                    for: taskId
+                                )
                             }
                         }
 
                         await MainActor.run {
                             guard !self.isCancelled else { return }
-                            if let idx = self.tasks.firstIndex(where: { $0.id == taskId }) {
+                            if let idx = self.index(ofTask: taskId) {
                                 self.tasks[idx].status = .completed(result: result)
                             }
                         }
-                    } catch let error as PDFConverter.ConversionError {
+                    } catch {
+                        let status = Self.taskStatus(for: error)
                         await MainActor.run {
-                            if !self.isCancelled {
-                                if let idx = self.tasks.firstIndex(where: { $0.id == taskId }) {
-                                    switch error {
-                                    case .cancelled:
-                                        self.tasks[idx].status = .cancelled // Handle cancellation properly
-                                    default:
-                                        self.tasks[idx].status = .failed(error: error.localizedDescription)
-                                    }
-                                }
-                            }
-                        }
-                    } catch { // Catch any other non-ConversionError
-                        await MainActor.run {
-                            if !self.isCancelled {
-                                if let idx = self.tasks.firstIndex(where: { $0.id == taskId }) {
-                                    self.tasks[idx].status = .failed(error: error.localizedDescription)
-                                }
+                            guard !self.isCancelled else { return }
+                            if let idx = self.index(ofTask: taskId) {
+                                self.tasks[idx].status = status
                             }
                         }
                     }
@@ -300,6 +292,69 @@ class AppState: ObservableObject {
         }
     }
 
+    /// 将转换错误映射为任务状态
+    private nonisolated static func taskStatus(for error: Error) -> TaskStatus {
+        if let conversionError = error as? PDFConverter.ConversionError,
+           case .cancelled = conversionError {
+            return .cancelled
+        }
+        return .failed(error: error.localizedDescription)
+    }
+
+    // MARK: - Progress Coalescing
+
+    /// 进度刷新间隔（纳秒）：多页文件每页都会回调，合并后最多约 20 次/秒刷新列表
+    private static let progressFlushInterval: UInt64 = 50_000_000
+
+    /// 待刷新的进度（每个任务只保留最新一次）
+    private var pendingProgress: [UUID: TaskStatus] = [:]
+    private var isProgressFlushScheduled = false
+
+    /// 记录进度，在下一次刷新时统一写入 tasks
+    private func enqueueProgress(_ status: TaskStatus, for taskId: UUID) {
+        guard !isCancelled else { return }
+        pendingProgress[taskId] = status
+        guard !isProgressFlushScheduled else { return }
+        isProgressFlushScheduled = true
+
+        Task { @MainActor [weak self] in
+            try? await Task.sleep(nanoseconds: Self.progressFlushInterval)
+            self?.flushProgress()
+        }
+    }
+
+    /// 一次性写回所有待刷新进度，tasks 只发布一次变更
+    private func flushProgress() {
+        isProgressFlushScheduled = false
+        guard !isCancelled, !pendingProgress.isEmpty else {
+            pendingProgress.removeAll()
+            return
+        }
+
+        var updatedTasks = tasks
+        for (taskId, status) in pendingProgress {
+            // 只更新仍在转换中的任务，避免迟到的进度覆盖已完成状态
+            guard let idx = index(ofTask: taskId),
+                  case .converting = updatedTasks[idx].status else { continue }
+            updatedTasks[idx].status = status
+        }
+        pendingProgress.removeAll()
+        tasks = updatedTasks
+    }
+
+    // MARK: - Task Lookup
+
+    /// 任务 ID → tasks 下标（每批开始时建立，避免每次回调线性查找）
+    private var taskIndices: [UUID: Int] = [:]
+
+    /// 查找任务下标；tasks 可能已被清空或重建，因此校验下标处仍是同一任务
+    private func index(ofTask taskId: UUID) -> Int? {
+        guard let index = taskIndices[taskId],
+              tasks.indices.contains(index),
+              tasks[index].id == taskId else { return nil }
+        return index
+    }
+
     /// 取消转换
     private var isCancelled = false
 
@@ -337,15 +392,40 @@ class AppState: ObservableObject {
                 self?.addFiles(urls)
             }
             .store(in: &cancellables)
+
+        // 设置变更合并保存：拖动滑块等连续修改只在停顿后写一次 UserDefaults，未变化的赋值直接忽略
+        $settings
+            .removeDuplicates()
+            .dropFirst()
+            .debounce(for: .milliseconds(400), scheduler: RunLoop.main)
+            .sink { $0.save() }
+            .store(in: &cancellables)
+
+        // 退出前立即保存，避免丢失尚未触发的延迟保存
+        NotificationCenter.default.publisher(for: NSApplication.willTerminateNotification)
+            .sink { [weak self] _ in
+                self?.settings.save()
+            }
+            .store(in: &cancellables)
+    }
+
+    /// 完成/错误音效（启动时加载一次，播放时无需再查找和解码音频文件）
+    private static let completionSound = NSSound(named: .init("Glass"))
+    private static let errorSound = NSSound(named: .init("Basso"))
+
+    /// 预加载音效，避免第一次转换结束时才读取音频文件
+    private func preloadSounds() {
+        _ = Self.completionSound
+        _ = Self.errorSound
     }
 
     /// 播放完成音效
     private func playCompletionSound() {
-        NSSound(named: .init("Glass"))?.play()
+        Self.completionSound?.play()
     }
 
     /// 播放错误音效
     private func playErrorSound() {
-        NSSound(named: .init("Basso"))?.play()
+        Self.errorSound?.play()
     }
 }
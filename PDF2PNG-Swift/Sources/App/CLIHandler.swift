@@ -4,106 +4,204 @@ import PDFKit
 
 /// CLI 模式处理器
 actor CLIHandler {
+    /// 命令行选项
+    struct Options {
+        var showHelp = false
+        var pdfPaths: [String] = []
+        var settings = ConversionSettings.default
+
+        /// 单次遍历解析参数（跳过 argv[0]）
+        static func parse(_ arguments: [String]) -> Options {
+            var options = Options()
+            var maxDPI: Int?
+            var minDPI: Int?
+            var maxSize: Double?
+
+            var seenPaths = Set<String>()
+
+            var iterator = arguments.dropFirst().makeIterator()
+            while let arg = iterator.next() {
+                switch arg {
+                case "-h", "--help":
+                    options.showHelp = true
+                case "--quality-first":
+                    options.settings.qualityFirst = true
+                case "--max-dpi":
+                    maxDPI = iterator.next().flatMap { Int($0) }
+                case "--min-dpi":
+                    minDPI = iterator.next().flatMap { Int($0) }
+                case "--max-size":
+                    maxSize = iterator.next().flatMap { Double($0) }
+                case "--output":
+                    if let path = iterator.next() {
+                        options.settings.outputDirectory = URL(fileURLWithPath: path)
+                    }
+                default:
+                    // 支持多个输入（如 shell 展开的 *.pdf），按标准化路径去重，避免并行转换同一文件
+                    if arg.hasPDFExtension,
+                       seenPaths.insert(URL(fileURLWithPath: arg, isDirectory: false).standardizedFileURL.path).inserted {
+                        options.pdfPaths.append(arg)
+                    }
+                }
+            }
+
+            // 先设最大值再设最小值，避免 didSet 钳制顺序影响结果
+            if let maxDPI { options.settings.maxDPI = maxDPI }
+            if let minDPI { options.settings.minDPI = minDPI }
+            if let maxSize { options.settings.maxSizeMB = maxSize }
+
+            return options
+        }
+    }
+
+    /// CLI 识别的选项
+    private static let knownFlags: Set<String> = [
+        "-h", "--help", "--quality-first", "--max-dpi", "--min-dpi", "--max-size", "--output"
+    ]
+
+    /// 仅预检参数是否包含 CLI 选项或 PDF 路径，不做完整解析
+    /// 系统注入的启动参数（如 -NSDocumentRevisionsDebugMode、-psn_）不会触发 CLI 模式
+    static func isCLIInvocation(_ arguments: [String]) -> Bool {
+        arguments.dropFirst().contains { knownFlags.contains($0) || $0.hasPDFExtension }
+    }
+
     static func run() async {
-        let args = CommandLine.arguments
+        let options = Options.parse(CommandLine.arguments)
 
         // 显示使用说明
-        if args.contains("-h") || args.contains("--help") {
+        if options.showHelp {
             printHelp()
             return
         }
 
-        // 解析参数
-        guard let pdfPath = args.first(where: { $0.hasSuffix(".pdf") }) else {
+        guard !options.pdfPaths.isEmpty else {
             print("❌ 错误: 未指定 PDF 文件")
             print("使用 --help 查看帮助")
             exit(1)
         }
 
-        let pdfURL = URL(fileURLWithPath: pdfPath)
-
-        // 解析设置
-        var settings = ConversionSettings.default
+        let pdfURLs = options.pdfPaths.map { URL(fileURLWithPath: $0) }
+        let settings = options.settings
 
-        if let maxDPIIndex = args.firstIndex(of: "--max-dpi"),
-           maxDPIIndex + 1 < args.count,
-           let maxDPI = Int(args[maxDPIIndex + 1]) {
-            settings.maxDPI = maxDPI
+        // 显示配置（拼接后一次输出）
+        var lines = ["📋 转换配置:"]
+        if pdfURLs.count == 1 {
+            lines.append("  输入文件: \(pdfURLs[0].path)")
+        } else {
+            lines.append("  输入文件: \(pdfURLs.count) 个")
         }
-
-        if let minDPIIndex = args.firstIndex(of: "--min-dpi"),
-           minDPIIndex + 1 < args.count,
-           let minDPI = Int(args[minDPIIndex + 1]) {
-            settings.minDPI = minDPI
+        lines.append("  模式: \(settings.qualityFirst ? "质量优先" : "大小限制")")
+        if settings.qualityFirst {
+            lines.append("  DPI: \(settings.maxDPI)")
+        } else {
+            lines.append("  大小限制: \(settings.maxSizeMB) MB")
+            lines.append("  DPI 范围: \(settings.minDPI) - \(settings.maxDPI)")
         }
+        lines.append("  输出目录: \(settings.outputDirectory?.path ?? "与源文件相同")")
+        lines.append("")
+        print(lines.joined(separator: "\n"))
 
-        if let maxSizeIndex = args.firstIndex(of: "--max-size"),
-           maxSizeIndex + 1 < args.count,
-           let maxSize = Double(args[maxSizeIndex + 1]) {
-            settings.maxSizeMB = maxSize
+        // 输出同名的输入（不同目录下同名文件 + --output）放入同一批依次转换，避免并行写同一文件
+        let batches = outputBatches(for: pdfURLs, outputDirectory: settings.outputDirectory)
+        for batch in batches where batch.count > 1 {
+            print("⚠️ 以下文件输出同名，将依次转换（后者覆盖前者）:")
+            print(batch.map { "  - \($0.path)" }.joined(separator: "\n"))
         }
 
-        if args.contains("--quality-first") {
-            settings.qualityFirst = true
-        }
+        // 执行转换：多个批次并行处理，并发上限与 GUI 共用 PDFConverter.maxConcurrentFiles
+        let converter = PDFConverter()
+        let labelsProgress = pdfURLs.count > 1
+        let hasFailures = await withTaskGroup(of: Bool.self) { group -> Bool in
+            var hasFailures = false
 
-        if let outputDirIndex = args.firstIndex(of: "--output"),
-           outputDirIndex + 1 < args.count {
-            settings.outputDirectory = URL(fileURLWithPath: args[outputDirIndex + 1])
-        }
+            for (index, batch) in batches.enumerated() {
+                if index >= PDFConverter.maxConcurrentFiles, let succeeded = await group.next() {
+                    hasFailures = hasFailures || !succeeded
+                }
+                group.addTask {
+                    var succeeded = true
+                    for pdfURL in batch {
+                        let fileSucceeded = await convertFile(pdfURL, settings: settings, converter: converter, labelsProgress: labelsProgress)
+                        succeeded = succeeded && fileSucceeded
+                    }
+                    return succeeded
+                }
+            }
 
-        // 显示配置
-        print("📋 转换配置:")
-        print("  输入文件: \(pdfURL.path)")
-        print("  模式: \(settings.qualityFirst ? "质量优先" : "大小限制")")
-        if settings.qualityFirst {
-            print("  DPI: \(settings.maxDPI)")
-        } else {
-            print("  大小限制: \(settings.maxSizeMB) MB")
-            print("  DPI 范围: \(settings.minDPI) - \(settings.maxDPI)")
+            for await succeeded in group {
+                hasFailures = hasFailures || !succeeded
+            }
+            return hasFailures
         }
-        print("  输出目录: \(settings.outputDirectory?.path ?? "与源文件相同")")
-        print("")
 
-        // 执行转换
-        let converter = PDFConverter()
+        exit(hasFailures ? 1 : 0)
+    }
+
+    /// 按输出位置分批：输出目录 + 文件名（不含扩展名，不区分大小写）相同的输入归为一批，保持输入顺序
+    static func outputBatches(for pdfURLs: [URL], outputDirectory: URL?) -> [[URL]] {
+        var batches: [[URL]] = []
+        var batchIndex: [String: Int] = [:]
+
+        for url in pdfURLs {
+            let directory = outputDirectory ?? url.deletingLastPathComponent()
+            let key = directory.standardizedFileURL
+                .appendingPathComponent(url.deletingPathExtension().lastPathComponent)
+                .path.lowercased()
+            if let index = batchIndex[key] {
+                batches[index].append(url)
+            } else {
+                batchIndex[key] = batches.count
+                batches.append([url])
+            }
+        }
+        return batches
+    }
 
+    /// 转换单个文件并输出结果，返回是否成功
+    private static func convertFile(
+        _ pdfURL: URL,
+        settings: ConversionSettings,
+        converter: PDFConverter,
+        labelsProgress: Bool
+    ) async -> Bool {
+        // 多文件并行时各文件输出会交错，进度行前加上文件名
+        let prefix = labelsProgress ? "[\(pdfURL.lastPathComponent)] " : ""
         do {
-            print("🚀 开始转换...")
+            print("🚀 开始转换: \(pdfURL.lastPathComponent)")
             let result = try await converter.convert(
                 pdfURL: pdfURL,
                 settings: settings,
                 progress: { info in
                     let percentage = Int(info.progress * 100)
-                    print("  进度: \(info.currentPage)/\(info.totalPages) (\(percentage)%)")
+                    print("  \(prefix)进度: \(info.currentPage)/\(info.totalPages) (\(percentage)%) → \(info.outputURL.lastPathComponent) @ \(info.dpi) DPI, \(formatBytes(info.sizeBytes))")
                 }
             )
 
-            print("")
-            print("✅ 转换成功!")
-            print("  输出文件数: \(result.outputURLs.count)")
-            print("  DPI 范围: \(result.dpiDisplay)")
-            print("  总大小: \(formatBytes(result.totalSizeBytes))")
-            print("  渲染时间: \(String(format: "%.2f", result.renderTimeMs)) ms")
-            print("")
-            print("📁 输出文件:")
-            for url in result.outputURLs {
-                if let size = fileSize(url: url) {
-                    print("  - \(url.lastPathComponent) (\(formatBytes(size)))")
-                }
+            // 结果汇总（拼接后一次输出，避免逐行写 stdout）
+            var lines = [
+                "",
+                "✅ \(prefix)转换成功!",
+                "  输出文件数: \(result.outputURLs.count)",
+                "  DPI 范围: \(result.dpiDisplay)",
+                "  总大小: \(formatBytes(result.totalSizeBytes))",
+                "  渲染时间: \(String(format: "%.2f", result.renderTimeMs)) ms",
+                "",
+                "📁 输出文件:"
+            ]
+            // 各页大小直接取自转换结果，无需再逐个 stat 输出文件
+            for (url, size) in zip(result.outputURLs, result.pageSizes) {
+                lines.append("  - \(url.lastPathComponent) (\(formatBytes(size)))")
             }
-
-            exit(0)
-
-        } catch let error as PDFConverter.ConversionError {
-            print("")
-            print("❌ 转换失败: \(error.localizedDescription)")
-            exit(1)
+            lines.append("")
+            print(lines.joined(separator: "\n"))
+            return true
 
         } catch {
-            print("")
-            print("❌ 未知错误: \(error)")
-            exit(1)
+            let message = error is PDFConverter.ConversionError
+                ? "转换失败: \(error.localizedDescription)"
+                : "未知错误: \(error)"
+            print("\n❌ \(prefix)\(message)\n")
+            return false
         }
     }
 
@@ -112,7 +210,7 @@ actor CLIHandler {
         PDF2PNG - PDF 到 PNG 高清转换工具 (CLI 模式)
 
         用法:
-          PDF2PNG <pdf文件> [选项]
+          PDF2PNG <pdf文件>... [选项]
 
         选项:
           --quality-first           质量优先模式（使用最高 DPI）
@@ -132,6 +230,9 @@ actor CLIHandler {
           # 自定义 DPI 范围
           PDF2PNG test.pdf --max-size 10 --min-dpi 200 --max-dpi 800
 
+          # 批量转换当前目录下所有 PDF
+          PDF2PNG *.pdf --max-size 5
+
           # 指定输出目录
           PDF2PNG test.pdf --output ~/Downloads
 
@@ -139,17 +240,10 @@ actor CLIHandler {
           - 默认使用大小限制模式 (5 MB)
           - 大小限制模式会自动调整 DPI 以满足文件大小要求
           - 多页 PDF 会创建子目录存放所有页面
+          - 并行渲染页数默认等于 CPU 核心数，可用环境变量 PDF2PNG_WORKERS 调整
         """)
     }
 
-    static func fileSize(url: URL) -> Int? {
-        guard let attrs = try? FileManager.default.attributesOfItem(atPath: url.path),
-              let size = attrs[.size] as? Int64 else {
-            return nil
-        }
-        return Int(size)
-    }
-
     static func formatBytes(_ bytes: Int) -> String {
         let kb = Double(bytes) / 1024
         let mb = kb / 1024
@@ -1,21 +1,27 @@
 import SwiftUI
 import Foundation
 
-/// PDF2PNG 应用入口
+/// 进程入口 - 在启动 SwiftUI 之前分流 CLI / GUI 模式
 @main
-struct PDF2PNGApp: App {
-    @NSApplicationDelegateAdaptor(AppDelegate.self) var appDelegate
-    @StateObject private var appState = AppState()
-
-    init() {
-        // 检查是否为 CLI 模式
-        if CommandLine.arguments.count > 1 {
+enum AppLauncher {
+    static func main() {
+        // CLI 模式：不创建 NSApplication / 窗口 / AppState，直接在后台执行转换
+        if CLIHandler.isCLIInvocation(CommandLine.arguments) {
             Task {
                 await CLIHandler.run()
                 exit(0)
             }
+            dispatchMain()
         }
+
+        PDF2PNGApp.main()
     }
+}
+
+/// PDF2PNG 应用
+struct PDF2PNGApp: App {
+    @NSApplicationDelegateAdaptor(AppDelegate.self) var appDelegate
+    @StateObject private var appState = AppState()
 
     var body: some Scene {
         WindowGroup {
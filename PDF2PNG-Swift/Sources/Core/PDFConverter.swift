@@ -2,6 +2,8 @@ import Foundation
 import PDFKit
 import AppKit
 import CoreGraphics
+import ImageIO
+import UniformTypeIdentifiers
 
 /// PDF 到 PNG 转换器
 actor PDFConverter {
@@ -14,6 +16,8 @@ actor PDFConverter {
         let maxDPI: Int      // 最高使用的 DPI
         let totalSizeBytes: Int
         let renderTimeMs: Double
+        /// 各页文件大小（字节），与 outputURLs 一一对应
+        let pageSizes: [Int]
 
         /// 兼容性：返回 DPI 显示字符串
         var dpiDisplay: String {
@@ -66,18 +70,37 @@ actor PDFConverter {
 
     private var isCancelled = false
     private static let pdfBaseDPI: CGFloat = 72.0
+    /// 渲染用色彩空间（所有渲染共用，避免每次渲染重新创建）
+    private static let renderColorSpace = CGColorSpace(name: CGColorSpace.sRGB)
 
     // MARK: - Public Methods
 
-    /// 进度信息
+    /// 进度信息（每完成一页回调一次，附带该页的输出结果，便于下游边转换边处理）
     struct ProgressInfo {
         let currentPage: Int
         let totalPages: Int
         let progress: Double
+        /// 刚完成的页面索引（从 0 开始）
+        let pageIndex: Int
+        /// 刚完成页面的输出文件
+        let outputURL: URL
+        /// 刚完成页面实际使用的 DPI
+        let dpi: Int
+        /// 刚完成页面的文件大小（字节）
+        let sizeBytes: Int
     }
 
-    /// 最大并行页面数
-    private static let maxConcurrentPages = 4
+    /// 最大并行转换文件数（GUI 与 CLI 共用）
+    static let maxConcurrentFiles = 3
+
+    /// 最大并行页面数：默认等于活跃 CPU 核心数，可用环境变量 PDF2PNG_WORKERS 覆盖
+    private static let maxConcurrentPages: Int = {
+        if let value = ProcessInfo.processInfo.environment["PDF2PNG_WORKERS"],
+           let workers = Int(value), workers > 0 {
+            return workers
+        }
+        return max(1, ProcessInfo.processInfo.activeProcessorCount)
+    }()
 
     /// 转换 PDF 到 PNG
     func convert(
@@ -114,26 +137,27 @@ actor PDFConverter {
 
         // 单页快速路径
         if pageCount == 1 {
-            guard let page = pdfDocument.page(at: 0) else {
-                throw ConversionError.renderFailed(String(localized: "error.cannotGetPage", bundle: .module).replacingOccurrences(of: "%d", with: "1"))
-            }
             let outputURL = actualOutputDir.appendingPathComponent("\(baseName).png")
-
-            // --- UNIFIED LOGIC ---
-            // Directly call convertPage, which contains the correct binary search / quality logic.
-            let (data, dpi) = try await convertPage(page: page, settings: settings)
-            try data.write(to: outputURL)
-
-            // Verify the output file size if not in quality-first mode
-            if !settings.qualityFirst {
-                try verifyOutputFileSize(url: outputURL, settings: settings, usedDPI: dpi)
-            }
-
-            // Report progress and return result
-            progress(ProgressInfo(currentPage: 1, totalPages: 1, progress: 1.0))
+            let page = try await convertAndWritePage(document: pdfDocument, pageIndex: 0, outputURL: outputURL, settings: settings)
+
+            progress(ProgressInfo(
+                currentPage: 1,
+                totalPages: 1,
+                progress: 1.0,
+                pageIndex: 0,
+                outputURL: outputURL,
+                dpi: page.dpi,
+                sizeBytes: page.size
+            ))
             let elapsed = (CFAbsoluteTimeGetCurrent() - startTime) * 1000
-            return ConversionResult(outputURLs: [outputURL], minDPI: dpi, maxDPI: dpi, totalSizeBytes: data.count, renderTimeMs: elapsed)
-            // --- END UNIFIED LOGIC ---
+            return ConversionResult(
+                outputURLs: [outputURL],
+                minDPI: page.dpi,
+                maxDPI: page.dpi,
+                totalSizeBytes: page.size,
+                renderTimeMs: elapsed,
+                pageSizes: [page.size]
+            )
         }
 
         // 多页文件：每页独立计算最优 DPI（严格模式）
@@ -141,39 +165,45 @@ actor PDFConverter {
         var completedCount = 0
 
         try await withThrowingTaskGroup(of: (Int, URL, Int, Int).self) { group in
+            /// 记录一页结果并更新进度
+            func record(_ result: (Int, URL, Int, Int)) throws {
+                guard !isCancelled else {
+                    throw ConversionError.cancelled
+                }
+                results.append(result)
+
+                // 更新进度
+                completedCount += 1
+                let progressValue = Double(completedCount) / Double(pageCount)
+                progress(ProgressInfo(
+                    currentPage: completedCount,
+                    totalPages: pageCount,
+                    progress: progressValue,
+                    pageIndex: result.0,
+                    outputURL: result.1,
+                    dpi: result.3,
+                    sizeBytes: result.2
+                ))
+            }
+
             for pageIndex in 0..<pageCount {
                 guard !isCancelled else { break }
 
-                group.addTask { [self] in
-                    guard let page = pdfDocument.page(at: pageIndex) else {
-                        throw ConversionError.renderFailed(String(localized: "error.cannotGetPage", bundle: .module).replacingOccurrences(of: "%d", with: "\(pageIndex + 1)"))
-                    }
+                // 控制并发数：窗口已满时先等待一页完成，避免一次性为所有页面分配位图
+                if pageIndex >= Self.maxConcurrentPages, let result = try await group.next() {
+                    try record(result)
+                }
 
+                group.addTask { [self] in
                     let outputURL = actualOutputDir.appendingPathComponent("page\(pageIndex + 1).png")
-
-                    // 每页独立计算最优 DPI（使用严格模式确保不超标）
-                    let (data, dpi) = try await self.convertPage(page: page, settings: settings)
-                    try data.write(to: outputURL)
-
-                    // 验证每页输出文件大小（质量优先模式跳过）
-                    if !settings.qualityFirst {
-                        try self.verifyOutputFileSize(url: outputURL, settings: settings, usedDPI: dpi)
-                    }
-
-                    return (pageIndex, outputURL, data.count, dpi)
+                    let page = try await self.convertAndWritePage(document: pdfDocument, pageIndex: pageIndex, outputURL: outputURL, settings: settings)
+                    return (pageIndex, outputURL, page.size, page.dpi)
                 }
             }
 
+            // 等待剩余页面完成
             for try await result in group {
-                guard !isCancelled else {
-                    throw ConversionError.cancelled
-                }
-                results.append(result)
-
-                // 更新进度
-                completedCount += 1
-                let progressValue = Double(completedCount) / Double(pageCount)
-                progress(ProgressInfo(currentPage: completedCount, totalPages: pageCount, progress: progressValue))
+                try record(result)
             }
         }
 
@@ -185,7 +215,8 @@ actor PDFConverter {
         results.sort { $0.index < $1.index }
 
         let outputURLs = results.map { $0.url }
-        let totalSize = results.reduce(0) { $0 + $1.size }
+        let pageSizes = results.map { $0.size }
+        let totalSize = pageSizes.reduce(0, +)
 
         // 统计 DPI 范围
         let dpiValues = results.map { $0.dpi }
@@ -199,7 +230,8 @@ actor PDFConverter {
             minDPI: resultMinDPI,
             maxDPI: resultMaxDPI,
             totalSizeBytes: totalSize,
-            renderTimeMs: elapsed
+            renderTimeMs: elapsed,
+            pageSizes: pageSizes
         )
     }
 
@@ -210,36 +242,49 @@ actor PDFConverter {
 
     // MARK: - Private Methods
 
-    /// 验证输出文件大小（保存后的最终检查）
-    private nonisolated func verifyOutputFileSize(
-        url: URL,
+    /// 验证输出大小（写入前的最终检查，直接使用内存中的 PNG 字节数）
+    private nonisolated func verifyOutputSize(
+        byteCount: Int,
         settings: ConversionSettings,
         usedDPI: Int
     ) throws {
-        // 使用 resourceValues - 最可靠的文件大小获取方法
-        guard let resources = try? url.resourceValues(forKeys: [.fileSizeKey]),
-              let fileSize = resources.fileSize else {
-            throw ConversionError.renderFailed("无法验证文件大小")
-        }
-
         let multiplier = settings.sizeCalculationMode == .safe ? 1_000_000.0 : 1_048_576.0
         let maxSizeBytes = Int64(settings.maxSizeMB * multiplier)
-        let fileSizeMB = Double(fileSize) / multiplier
 
         // 严格验证：文件大小必须 <= 限制
-        if Int64(fileSize) > maxSizeBytes {
-            // 删除超标文件
-            try? FileManager.default.removeItem(at: url)
-
-            // 抛出错误
+        if Int64(byteCount) > maxSizeBytes {
             throw ConversionError.sizeLimitExceeded(
-                currentSizeMB: fileSizeMB,
+                currentSizeMB: Double(byteCount) / multiplier,
                 limitMB: settings.maxSizeMB,
                 minDPI: usedDPI
             )
         }
     }
 
+    /// 渲染、写入并校验单个页面（单页与多页路径共用）
+    /// nonisolated：写盘不占用 actor，多页/多文件的写入可并行，进度回调与取消也不会被阻塞
+    private nonisolated func convertAndWritePage(
+        document: PDFDocument,
+        pageIndex: Int,
+        outputURL: URL,
+        settings: ConversionSettings
+    ) async throws -> (size: Int, dpi: Int) {
+        guard let page = document.page(at: pageIndex) else {
+            throw ConversionError.renderFailed(String(localized: "error.cannotGetPage", bundle: .module).replacingOccurrences(of: "%d", with: "\(pageIndex + 1)"))
+        }
+
+        // 每页独立计算最优 DPI（使用严格模式确保不超标）
+        let (data, dpi) = try await convertPage(page: page, settings: settings)
+
+        // 写入前验证大小（质量优先模式跳过），超标数据不落盘
+        if !settings.qualityFirst {
+            try verifyOutputSize(byteCount: data.count, settings: settings, usedDPI: dpi)
+        }
+
+        try data.write(to: outputURL)
+        return (data.count, dpi)
+    }
+
     /// 转换单个页面（在后台线程执行）
     private func convertPage(
         page: PDFPage,
@@ -257,11 +302,10 @@ actor PDFConverter {
 
     // MARK: - Quality-First Mode
 
-    /// 质量优先模式：使用指定 DPI 渲染，并启用压缩
-    /// 核心逻辑：DPI 固定，在保证清晰度不变的情况下启用 PNG 压缩
+    /// 质量优先模式：使用指定 DPI 渲染
+    /// 核心逻辑：DPI 固定，PNG 为无损编码，清晰度只由 DPI 决定
     private nonisolated func renderWithQuality(page: PDFPage, dpi: Int) throws -> (Data, Int) {
-        // ✅ 使用 0.85 压缩系数（1.0 是最大压缩，0.85 平衡质量和大小）
-        let data = try renderPage(page: page, dpi: dpi, compression: 0.85)
+        let data = try renderPage(page: page, dpi: dpi)
         return (data, dpi)
     }
 
@@ -287,7 +331,10 @@ actor PDFConverter {
 
         // Step 2: 检查用户设置的最小 DPI 是否可行
         // ✅ 修复：严格遵守用户的 minDPI 设置，不再降到 absoluteMinDPI
-        let minData = try renderPage(page: page, dpi: settings.minDPI)
+        // minDPI 与 maxDPI 相同时直接复用 Step 1 的结果，不重复渲染
+        let minData = try settings.minDPI == settings.maxDPI
+            ? maxData
+            : renderPage(page: page, dpi: settings.minDPI)
         if minData.count >= safeSizeBytes {
             // 用户的 minDPI 无法满足大小限制，抛出清晰的错误提示
             let currentSizeMB = Double(minData.count) / multiplier
@@ -299,25 +346,37 @@ actor PDFConverter {
             )
         }
 
-        // Step 3: 精确二分查找（精度 1 DPI，使用安全阈值）
+        // Step 3: 插值查找（精度 1 DPI，使用安全阈值）
+        // 区间两端的实测大小作为样本，按大小模型直接估算目标 DPI，比盲目二分少渲染几次
         var low = settings.minDPI
         var high = settings.maxDPI
+        var lowSize = minData.count
+        var highSize = maxData.count
         var bestData = minData
         var bestDPI = settings.minDPI
+        var bisectNext = false
 
         while high - low > 1 {
-            let midDPI = (low + high) / 2
+            let width = high - low
+            let midDPI = bisectNext
+                ? (low + high) / 2
+                : Self.interpolatedDPI(low: low, lowSize: lowSize, high: high, highSize: highSize, target: safeSizeBytes)
             let midData = try renderPage(page: page, dpi: midDPI)
 
             if midData.count < safeSizeBytes {
                 // 可行，尝试更高 DPI
                 low = midDPI
+                lowSize = midData.count
                 bestData = midData
                 bestDPI = midDPI
             } else {
                 // 超标或接近临界值，降低 DPI
                 high = midDPI
+                highSize = midData.count
             }
+
+            // 插值未能把区间缩小一半时，下一步退回二分，保证最坏情况仍为 O(log n)
+            bisectNext = !bisectNext && (high - low) * 2 > width
         }
 
         // Step 4: 最终强制验证（确保绝对不超过真实限制）
@@ -333,20 +392,37 @@ actor PDFConverter {
         return (bestData, bestDPI)
     }
 
+    /// 用样本 (low, lowSize)、(high, highSize) 拟合幂律 size ≈ a·dpi^k，反解目标大小对应的 DPI
+    /// 每页单独拟合指数 k（文字/矢量页面通常明显小于 2），比线性插值更贴近真实曲线
+    /// 结果限制在开区间 (low, high) 内，保证每次查找都能缩小区间
+    static func interpolatedDPI(low: Int, lowSize: Int, high: Int, highSize: Int, target: Int) -> Int {
+        guard low > 0, lowSize > 0, highSize > lowSize else { return (low + high) / 2 }
+        let exponent = log(Double(highSize) / Double(lowSize)) / log(Double(high) / Double(low))
+        let estimate = Double(low) * pow(Double(target) / Double(lowSize), 1 / exponent)
+        guard estimate.isFinite else { return (low + high) / 2 }
+        return min(max(Int(estimate), low + 1), high - 1)
+    }
+
+    /// 指定 DPI 下的位图尺寸（RGBX，每像素 4 字节）
+    private nonisolated func bitmapSize(page: PDFPage, dpi: Int) -> (width: Int, height: Int) {
+        let pageRect = page.bounds(for: .mediaBox)
+        let scale = CGFloat(dpi) / Self.pdfBaseDPI
+        return (Int(pageRect.width * scale), Int(pageRect.height * scale))
+    }
+
     /// 渲染页面为 PNG 数据（nonisolated 因为不访问 actor 状态）
     /// - Parameters:
     ///   - page: PDF 页面
     ///   - dpi: DPI 值
-    ///   - compression: PNG 压缩系数 (0.0-1.0)，0.0=无压缩，1.0=最大压缩
-    private nonisolated func renderPage(page: PDFPage, dpi: Int, compression: Double = 0.0) throws -> Data {
-        let pageRect = page.bounds(for: .mediaBox)
+    private nonisolated func renderPage(
+        page: PDFPage,
+        dpi: Int
+    ) throws -> Data {
         let scale = CGFloat(dpi) / Self.pdfBaseDPI
-
-        let width = Int(pageRect.width * scale)
-        let height = Int(pageRect.height * scale)
+        let (width, height) = bitmapSize(page: page, dpi: dpi)
 
         // 创建位图上下文
-        guard let colorSpace = CGColorSpace(name: CGColorSpace.sRGB),
+        guard let colorSpace = Self.renderColorSpace,
               let context = CGContext(
                 data: nil,
                 width: width,
@@ -372,23 +448,23 @@ actor PDFConverter {
             throw ConversionError.renderFailed(String(localized: "error.cannotGenerateImage", bundle: .module))
         }
 
-        // 转换为 PNG（应用压缩）
-        let bitmapRep = NSBitmapImageRep(cgImage: cgImage)
-
-        // ✅ 应用 PNG 压缩（如果 compression > 0）
-        let properties: [NSBitmapImageRep.PropertyKey: Any]
-        if compression > 0 {
-            // 质量优先模式：启用压缩以减小文件大小
-            properties = [.compressionFactor: NSNumber(value: compression)]
-        } else {
-            // 大小限制模式：无压缩，精确控制文件大小
-            properties = [:]
+        // 转换为 PNG：直接用 ImageIO 编码 CGImage，省去 NSBitmapImageRep 中间对象
+        let pngData = NSMutableData()
+        guard let destination = CGImageDestinationCreateWithData(
+            pngData as CFMutableData,
+            UTType.png.identifier as CFString,
+            1,
+            nil
+        ) else {
+            throw ConversionError.renderFailed(String(localized: "error.cannotGeneratePNG", bundle: .module))
         }
 
-        guard let pngData = bitmapRep.representation(using: .png, properties: properties) else {
+        // PNG 为无损格式，ImageIO 会忽略有损压缩质量参数，无需传入编码选项
+        CGImageDestinationAddImage(destination, cgImage, nil)
+        guard CGImageDestinationFinalize(destination) else {
             throw ConversionError.renderFailed(String(localized: "error.cannotGeneratePNG", bundle: .module))
         }
 
-        return pngData
+        return pngData as Data
     }
 }
@@ -13,7 +13,12 @@ class LanguageManager: ObservableObject {
     }
 
     /// 当前语言的 Bundle
-    @Published private(set) var bundle: Bundle = .main
+    @Published private(set) var bundle: Bundle = .main {
+        didSet { strings = Self.loadStrings(from: bundle) }
+    }
+
+    /// 当前语言的字符串表（切换语言时预加载，查找只需一次字典访问）
+    private var strings: [String: String] = [:]
 
     /// 刷新标识符 - 用于强制刷新视图
     @Published var refreshID = UUID()
@@ -89,6 +94,15 @@ class LanguageManager: ObservableObject {
 
     /// 获取本地化字符串
     func localized(_ key: String) -> String {
-        bundle.localizedString(forKey: key, value: nil, table: nil)
+        strings[key] ?? bundle.localizedString(forKey: key, value: nil, table: nil)
+    }
+
+    /// 读取 Bundle 中的 Localizable.strings（文本或二进制 plist 均可）
+    private static func loadStrings(from bundle: Bundle) -> [String: String] {
+        guard let url = bundle.url(forResource: "Localizable", withExtension: "strings"),
+              let table = NSDictionary(contentsOf: url) as? [String: String] else {
+            return [:]
+        }
+        return table
     }
 }
@@ -1,7 +1,7 @@
 import Foundation
 
 /// 转换设置
-struct ConversionSettings: Codable {
+struct ConversionSettings: Codable, Equatable {
     // MARK: - Constants
 
     static let minAllowedDPI = 72
@@ -140,15 +140,36 @@ struct ConversionSettings: Codable {
     }
 }
 
+// MARK: - 容错解码
+
+extension ConversionSettings {
+    /// 逐字段解码：缺失或类型不符的字段回退到默认值，而不是整体丢弃已保存的设置
+    init(from decoder: Decoder) throws {
+        let container = try decoder.container(keyedBy: CodingKeys.self)
+        let defaults = Self.default
+
+        maxSizeMB = (try? container.decodeIfPresent(Double.self, forKey: .maxSizeMB)) ?? defaults.maxSizeMB
+        minDPI = (try? container.decodeIfPresent(Int.self, forKey: .minDPI)) ?? defaults.minDPI
+        maxDPI = (try? container.decodeIfPresent(Int.self, forKey: .maxDPI)) ?? defaults.maxDPI
+        qualityFirst = (try? container.decodeIfPresent(Bool.self, forKey: .qualityFirst)) ?? defaults.qualityFirst
+        sizeCalculationMode = (try? container.decodeIfPresent(SizeCalculationMode.self, forKey: .sizeCalculationMode)) ?? defaults.sizeCalculationMode
+        outputDirectory = (try? container.decodeIfPresent(URL.self, forKey: .outputDirectory)) ?? defaults.outputDirectory
+    }
+}
+
 // MARK: - UserDefaults 存储
 
 extension ConversionSettings {
     private static let userDefaultsKey = "ConversionSettings"
 
+    /// 复用编解码器（save 在每次设置变更时调用）
+    private static let encoder = JSONEncoder()
+    private static let decoder = JSONDecoder()
+
     /// 从 UserDefaults 加载
     static func load() -> ConversionSettings {
         guard let data = UserDefaults.standard.data(forKey: userDefaultsKey),
-              var settings = try? JSONDecoder().decode(ConversionSettings.self, from: data) else {
+              var settings = try? decoder.decode(ConversionSettings.self, from: data) else {
             return .default
         }
         // 验证并修正加载的设置
@@ -158,7 +179,7 @@ extension ConversionSettings {
 
     /// 保存到 UserDefaults
     func save() {
-        guard let data = try? JSONEncoder().encode(self) else { return }
+        guard let data = try? Self.encoder.encode(self) else { return }
         UserDefaults.standard.set(data, forKey: Self.userDefaultsKey)
     }
 }
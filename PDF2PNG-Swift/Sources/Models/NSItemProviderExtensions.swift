@@ -0,0 +1,44 @@
+import Foundation
+import UniformTypeIdentifiers
+
+extension NSItemProvider {
+    /// 收集拖入的 PDF 文件，全部加载完成后在主线程一次性回调（批量拖入时只更新一次列表）
+    static func loadPDFURLs(from providers: [NSItemProvider], completion: @escaping ([URL]) -> Void) {
+        let group = DispatchGroup()
+        let lock = NSLock()
+        var urls: [URL] = []
+
+        func append(_ url: URL) {
+            lock.lock()
+            urls.append(url)
+            lock.unlock()
+        }
+
+        for provider in providers {
+            if provider.hasItemConformingToTypeIdentifier(UTType.pdf.identifier) {
+                group.enter()
+                provider.loadItem(forTypeIdentifier: UTType.pdf.identifier, options: nil) { item, _ in
+                    if let url = item as? URL {
+                        append(url)
+                    }
+                    group.leave()
+                }
+            } else if provider.hasItemConformingToTypeIdentifier(UTType.fileURL.identifier) {
+                group.enter()
+                provider.loadItem(forTypeIdentifier: UTType.fileURL.identifier, options: nil) { item, _ in
+                    if let data = item as? Data,
+                       let url = URL(dataRepresentation: data, relativeTo: nil),
+                       url.isPDF {
+                        append(url)
+                    }
+                    group.leave()
+                }
+            }
+        }
+
+        group.notify(queue: .main) {
+            guard !urls.isEmpty else { return }
+            completion(urls)
+        }
+    }
+}
@@ -0,0 +1,15 @@
+import Foundation
+
+extension URL {
+    /// 是否为 PDF 文件（只比较扩展名，不区分大小写，无需生成小写副本）
+    var isPDF: Bool {
+        pathExtension.caseInsensitiveCompare("pdf") == .orderedSame
+    }
+}
+
+extension String {
+    /// 路径字符串是否以 .pdf 结尾（不区分大小写，纯字符串判断，不访问文件系统）
+    var hasPDFExtension: Bool {
+        (self as NSString).pathExtension.caseInsensitiveCompare("pdf") == .orderedSame
+    }
+}
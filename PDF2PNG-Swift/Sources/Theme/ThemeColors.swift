@@ -9,65 +9,94 @@ struct ThemeColors {
         ThemeManager.shared.isDarkMode
     }
 
-    // 主色调
-    static var backgroundPrimary: Color {
-        isDark ? Color(hex: "#302723") : Color(hex: "#f5f0eb")
-    }
-    static var backgroundSecondary: Color {
-        isDark ? Color(hex: "#3d322e") : Color(hex: "#e8e0d8")
-    }
-    static var backgroundTertiary: Color {
-        isDark ? Color(hex: "#4a3f3a") : Color(hex: "#ddd5cd")
+    /// 单一主题下随模式变化的颜色
+    private struct Palette {
+        let backgroundPrimary: Color
+        let backgroundSecondary: Color
+        let backgroundTertiary: Color
+        let backgroundInput: Color
+        let borderNormal: Color
+        let borderHover: Color
+        let textPrimary: Color
+        let textSecondary: Color
+        let textMuted: Color
+        let pickerAccent: Color
+        let fileIcon: Color
+        let statusTextSuccess: Color
+        let statusTextError: Color
+        let statusTextProgress: Color
     }
-    static var backgroundInput: Color {
-        isDark ? Color(hex: "#252019") : Color(hex: "#ffffff")
+
+    // 深色/浅色调色板只解析一次十六进制，之后每次取色都是直接读取
+    private static let darkPalette = Palette(
+        backgroundPrimary: Color(hex: "#302723"),
+        backgroundSecondary: Color(hex: "#3d322e"),
+        backgroundTertiary: Color(hex: "#4a3f3a"),
+        backgroundInput: Color(hex: "#252019"),
+        borderNormal: Color(hex: "#5a4f4a"),
+        borderHover: Color(hex: "#6a5f5a"),
+        textPrimary: Color.white,
+        textSecondary: Color(hex: "#e0d5d0"),
+        textMuted: Color(hex: "#c0b5b0"),
+        pickerAccent: Color(hex: "#ffd34d"),
+        fileIcon: Color(hex: "#ffd34d"),
+        statusTextSuccess: Color(hex: "#86c794"),
+        statusTextError: Color(hex: "#d88888"),
+        statusTextProgress: Color(hex: "#d4b56a")
+    )
+
+    private static let lightPalette = Palette(
+        backgroundPrimary: Color(hex: "#f5f0eb"),
+        backgroundSecondary: Color(hex: "#e8e0d8"),
+        backgroundTertiary: Color(hex: "#ddd5cd"),
+        backgroundInput: Color(hex: "#ffffff"),
+        borderNormal: Color(hex: "#c0b5a8"),
+        borderHover: Color(hex: "#a09588"),
+        textPrimary: Color(hex: "#333333"),
+        textSecondary: Color(hex: "#555555"),
+        textMuted: Color(hex: "#777777"),
+        pickerAccent: Color(hex: "#d4a017"),  // 浅色模式用深色以增加对比度
+        fileIcon: Color(hex: "#555555"),
+        statusTextSuccess: Color(hex: "#3d7a4a"),
+        statusTextError: Color(hex: "#b54545"),
+        statusTextProgress: Color(hex: "#a08030")
+    )
+
+    private static var palette: Palette {
+        isDark ? darkPalette : lightPalette
     }
 
+    // 主色调
+    static var backgroundPrimary: Color { palette.backgroundPrimary }
+    static var backgroundSecondary: Color { palette.backgroundSecondary }
+    static var backgroundTertiary: Color { palette.backgroundTertiary }
+    static var backgroundInput: Color { palette.backgroundInput }
+
     // 边框
-    static var borderNormal: Color {
-        isDark ? Color(hex: "#5a4f4a") : Color(hex: "#c0b5a8")
-    }
-    static var borderHover: Color {
-        isDark ? Color(hex: "#6a5f5a") : Color(hex: "#a09588")
-    }
+    static var borderNormal: Color { palette.borderNormal }
+    static var borderHover: Color { palette.borderHover }
 
     // 文字
-    static var textPrimary: Color {
-        isDark ? Color.white : Color(hex: "#333333")
-    }
-    static var textSecondary: Color {
-        isDark ? Color(hex: "#e0d5d0") : Color(hex: "#555555")
-    }
-    static var textMuted: Color {
-        isDark ? Color(hex: "#c0b5b0") : Color(hex: "#777777")
-    }
+    static var textPrimary: Color { palette.textPrimary }
+    static var textSecondary: Color { palette.textSecondary }
+    static var textMuted: Color { palette.textMuted }
 
     // 强调色
     static let accent = Color(hex: "#ffd34d")
     static let accentHover = Color(hex: "#FFE082")
 
     // 选择器强调色 - 浅色模式用深色以增加对比度
-    static var pickerAccent: Color {
-        isDark ? Color(hex: "#ffd34d") : Color(hex: "#d4a017")
-    }
+    static var pickerAccent: Color { palette.pickerAccent }
 
     // 文件图标色
-    static var fileIcon: Color {
-        isDark ? Color(hex: "#ffd34d") : Color(hex: "#555555")
-    }
+    static var fileIcon: Color { palette.fileIcon }
 
     // 状态色（用于图标）
     static let success = Color(hex: "#4ade80")
     static let error = Color(hex: "#ef4444")
 
     // 状态文字色（低饱和度，易读）
-    static var statusTextSuccess: Color {
-        isDark ? Color(hex: "#86c794") : Color(hex: "#3d7a4a")
-    }
-    static var statusTextError: Color {
-        isDark ? Color(hex: "#d88888") : Color(hex: "#b54545")
-    }
-    static var statusTextProgress: Color {
-        isDark ? Color(hex: "#d4b56a") : Color(hex: "#a08030")
-    }
+    static var statusTextSuccess: Color { palette.statusTextSuccess }
+    static var statusTextError: Color { palette.statusTextError }
+    static var statusTextProgress: Color { palette.statusTextProgress }
 }
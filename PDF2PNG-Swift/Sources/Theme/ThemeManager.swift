@@ -31,7 +31,11 @@ class ThemeManager: ObservableObject {
 
     private func updateTheme() {
         if let appearance = NSApp.effectiveAppearance.bestMatch(from: [.darkAqua, .aqua]) {
-            isDarkMode = appearance == .darkAqua
+            // 仅在主题实际变化时赋值，@Published 赋相同值也会触发全部视图重绘
+            let isDark = appearance == .darkAqua
+            if isDark != isDarkMode {
+                isDarkMode = isDark
+            }
         }
     }
 
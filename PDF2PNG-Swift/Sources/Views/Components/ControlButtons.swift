@@ -45,8 +45,8 @@ struct ThemeToggleButton: View {
                 isHovering = hovering
             }
             .help(themeManager.isDarkMode
-                ? String(localized: "theme.switchToLight", bundle: LanguageManager.shared.bundle)
-                : String(localized: "theme.switchToDark", bundle: LanguageManager.shared.bundle))
+                ? LanguageManager.shared.localized("theme.switchToLight")
+                : LanguageManager.shared.localized("theme.switchToDark"))
     }
 }
 
@@ -72,8 +72,8 @@ struct SettingsToggleButton: View {
                 isHovering = hovering
             }
             .help(isExpanded
-                ? String(localized: "theme.collapse", bundle: LanguageManager.shared.bundle)
-                : String(localized: "theme.expand", bundle: LanguageManager.shared.bundle))
+                ? LanguageManager.shared.localized("theme.collapse")
+                : LanguageManager.shared.localized("theme.expand"))
     }
 }
 
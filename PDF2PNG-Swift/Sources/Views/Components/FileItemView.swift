@@ -5,6 +5,9 @@ struct FileItemView: View {
     let status: TaskStatus?
     let onRemove: (() -> Void)?
 
+    /// 文件大小（每个文件只读取一次，避免每次重绘都 stat）
+    @State private var fileSizeString = ""
+
     var body: some View {
         HStack(spacing: 8) {
             // PDF 图标
@@ -56,14 +59,18 @@ struct FileItemView: View {
             RoundedRectangle(cornerRadius: 6)
                 .stroke(ThemeColors.borderNormal, lineWidth: 1)
         )
+        .task(id: url) {
+            if status == nil {
+                fileSizeString = Self.formattedFileSize(of: url)
+            }
+        }
     }
 
-    private var fileSizeString: String {
-        guard let attrs = try? FileManager.default.attributesOfItem(atPath: url.path),
-              let size = attrs[.size] as? Int64 else {
+    private static func formattedFileSize(of url: URL) -> String {
+        guard let size = try? url.resourceValues(forKeys: [.fileSizeKey]).fileSize else {
             return ""
         }
-        return ByteCountFormatter.string(fromByteCount: size, countStyle: .file)
+        return ByteCountFormatter.string(fromByteCount: Int64(size), countStyle: .file)
     }
 
     private var statusColor: Color {
@@ -31,27 +31,7 @@ struct YellowDropZone: View {
             }
         }
         .onDrop(of: [UTType.pdf, UTType.fileURL], isTargeted: $isHovering) { providers in
-            for provider in providers {
-                if provider.hasItemConformingToTypeIdentifier(UTType.pdf.identifier) {
-                    provider.loadItem(forTypeIdentifier: UTType.pdf.identifier, options: nil) { item, _ in
-                        if let url = item as? URL {
-                            DispatchQueue.main.async {
-                                onDrop([url])
-                            }
-                        }
-                    }
-                } else if provider.hasItemConformingToTypeIdentifier(UTType.fileURL.identifier) {
-                    provider.loadItem(forTypeIdentifier: UTType.fileURL.identifier, options: nil) { item, _ in
-                        if let data = item as? Data,
-                           let url = URL(dataRepresentation: data, relativeTo: nil),
-                           url.pathExtension.lowercased() == "pdf" {
-                            DispatchQueue.main.async {
-                                onDrop([url])
-                            }
-                        }
-                    }
-                }
-            }
+            NSItemProvider.loadPDFURLs(from: providers, completion: onDrop)
             return true
         }
     }
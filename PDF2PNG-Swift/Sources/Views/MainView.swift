@@ -38,20 +38,20 @@ struct MainView: View {
                 appState.showError(error.localizedDescription)
             }
         }
-        .alert(String(localized: "error.title", bundle: LanguageManager.shared.bundle), isPresented: $appState.showError) {
-            Button(String(localized: "error.ok", bundle: LanguageManager.shared.bundle), role: .cancel) {}
+        .alert(LanguageManager.shared.localized("error.title"), isPresented: $appState.showError) {
+            Button(LanguageManager.shared.localized("error.ok"), role: .cancel) {}
         } message: {
-            Text(appState.errorMessage ?? String(localized: "error.unknown", bundle: LanguageManager.shared.bundle))
+            Text(appState.errorMessage ?? LanguageManager.shared.localized("error.unknown"))
         }
-        .alert(String(localized: "overwrite.title", bundle: LanguageManager.shared.bundle), isPresented: $appState.showOverwriteConfirm) {
-            Button(String(localized: "overwrite.cancel", bundle: LanguageManager.shared.bundle), role: .cancel) {
+        .alert(LanguageManager.shared.localized("overwrite.title"), isPresented: $appState.showOverwriteConfirm) {
+            Button(LanguageManager.shared.localized("overwrite.cancel"), role: .cancel) {
                 appState.filesToOverwrite = []
             }
-            Button(String(localized: "overwrite.confirm", bundle: LanguageManager.shared.bundle), role: .destructive) {
+            Button(LanguageManager.shared.localized("overwrite.confirm"), role: .destructive) {
                 appState.confirmOverwriteAndConvert()
             }
         } message: {
-            Text(String(localized: "overwrite.message", bundle: LanguageManager.shared.bundle).replacingOccurrences(of: "%@", with: appState.filesToOverwrite.joined(separator: "\n")))
+            Text(LanguageManager.shared.localized("overwrite.message").replacingOccurrences(of: "%@", with: appState.filesToOverwrite.joined(separator: "\n")))
         }
     }
 
@@ -173,7 +173,7 @@ struct MainView: View {
                 HStack(spacing: 12) {
                     // 模式切换
                     HStack(spacing: 0) {
-                        Button(action: { appState.settings.qualityFirst = true }) {
+                        Button(action: { if !appState.settings.qualityFirst { appState.settings.qualityFirst = true } }) {
                             Text(LanguageManager.shared.localized("settings.qualityFirst"))
                                 .font(.system(size: 11, weight: .medium))
                                 .foregroundColor(appState.settings.qualityFirst ? ThemeColors.pickerAccent : ThemeColors.textMuted)
@@ -189,7 +189,7 @@ struct MainView: View {
                             .fill(ThemeColors.borderNormal)
                             .frame(width: 1, height: 16)
 
-                        Button(action: { appState.settings.qualityFirst = false }) {
+                        Button(action: { if appState.settings.qualityFirst { appState.settings.qualityFirst = false } }) {
                             Text(LanguageManager.shared.localized("settings.sizeLimit"))
                                 .font(.system(size: 11, weight: .medium))
                                 .foregroundColor(appState.settings.qualityFirst ? ThemeColors.textMuted : ThemeColors.pickerAccent)
@@ -215,7 +215,7 @@ struct MainView: View {
                         ThemedNSSlider(
                             value: Binding(
                                 get: { Double(appState.settings.maxDPI) },
-                                set: { appState.settings.maxDPI = Int($0) }
+                                set: { if Int($0) != appState.settings.maxDPI { appState.settings.maxDPI = Int($0) } }
                             ),
                             range: 150...2400,  // ✅ 修复：与 SettingsView 保持一致，支持到 2400
                             increment: 10  // 每次移动 10 DPI
@@ -309,11 +309,11 @@ struct MainView: View {
     /// 转换按钮标题
     private var convertButtonTitle: String {
         if !appState.pendingFiles.isEmpty {
-            return String(localized: "button.startConvert", bundle: LanguageManager.shared.bundle)
+            return LanguageManager.shared.localized("button.startConvert")
         } else if hasFailedTasks || hasCompletedTasks {
-            return String(localized: "button.restart", bundle: LanguageManager.shared.bundle)
+            return LanguageManager.shared.localized("button.restart")
         }
-        return String(localized: "button.startConvert", bundle: LanguageManager.shared.bundle)
+        return LanguageManager.shared.localized("button.startConvert")
     }
 
 
@@ -321,12 +321,9 @@ struct MainView: View {
     /// 文件列表摘要（文件数量 + 当前设置）
     private var fileListSummary: String {
         let count = appState.pendingFiles.count + appState.tasks.count
-        let setting = appState.settings.qualityFirst
-            ? "\(appState.settings.maxDPI) DPI"
-            : "\(Int(appState.settings.maxSizeMB)) MB"
-        return String(localized: "fileList.summary", defaultValue: "\(count) files · \(setting)")
+        return LanguageManager.shared.localized("fileList.summary")
             .replacingOccurrences(of: "%d", with: "\(count)")
-            .replacingOccurrences(of: "%@", with: setting)
+            .replacingOccurrences(of: "%@", with: settingsSummary)
     }
 
     // MARK: - File List
@@ -464,26 +461,8 @@ struct MainView: View {
     // MARK: - Methods
 
     private func handleDrop(providers: [NSItemProvider]) {
-        for provider in providers {
-            if provider.hasItemConformingToTypeIdentifier(UTType.pdf.identifier) {
-                provider.loadItem(forTypeIdentifier: UTType.pdf.identifier, options: nil) { item, _ in
-                    if let url = item as? URL {
-                        DispatchQueue.main.async {
-                            appState.addFiles([url])
-                        }
-                    }
-                }
-            } else if provider.hasItemConformingToTypeIdentifier(UTType.fileURL.identifier) {
-                provider.loadItem(forTypeIdentifier: UTType.fileURL.identifier, options: nil) { item, _ in
-                    if let data = item as? Data,
-                       let url = URL(dataRepresentation: data, relativeTo: nil),
-                       url.pathExtension.lowercased() == "pdf" {
-                        DispatchQueue.main.async {
-                            appState.addFiles([url])
-                        }
-                    }
-                }
-            }
+        NSItemProvider.loadPDFURLs(from: providers) { urls in
+            appState.addFiles(urls)
         }
     }
 }
@@ -522,6 +501,7 @@ struct ThemedNumberField: NSViewRepresentable {
         textField.layer?.masksToBounds = true
 
         textField.stringValue = "\(value)"
+        context.coordinator.appliedDarkMode = ThemeManager.shared.isDarkMode
         return textField
     }
 
@@ -529,10 +509,14 @@ struct ThemedNumberField: NSViewRepresentable {
         if !context.coordinator.isEditing {
             nsView.stringValue = "\(value)"
         }
-        // 更新主题相关颜色
-        nsView.backgroundColor = NSColor(ThemeColors.backgroundInput)
-        nsView.textColor = NSColor(ThemeColors.textPrimary)
-        nsView.layer?.borderColor = NSColor(ThemeColors.borderNormal).cgColor
+        // 仅在主题切换后更新颜色，输入值变化时无需重建 NSColor
+        let isDarkMode = ThemeManager.shared.isDarkMode
+        if context.coordinator.appliedDarkMode != isDarkMode {
+            context.coordinator.appliedDarkMode = isDarkMode
+            nsView.backgroundColor = NSColor(ThemeColors.backgroundInput)
+            nsView.textColor = NSColor(ThemeColors.textPrimary)
+            nsView.layer?.borderColor = NSColor(ThemeColors.borderNormal).cgColor
+        }
     }
 
     func makeCoordinator() -> Coordinator {
@@ -542,6 +526,8 @@ struct ThemedNumberField: NSViewRepresentable {
     class Coordinator: NSObject, NSTextFieldDelegate {
         var parent: ThemedNumberField
         var isEditing = false
+        /// 上次应用颜色时的主题
+        var appliedDarkMode: Bool?
 
         init(_ parent: ThemedNumberField) {
             self.parent = parent
@@ -617,6 +603,7 @@ struct MaxSizeInputField: NSViewRepresentable {
 
         // 初始值
         textField.stringValue = formatValue(value)
+        context.coordinator.appliedDarkMode = themeManager.isDarkMode
 
         return textField
     }
@@ -631,12 +618,10 @@ struct MaxSizeInputField: NSViewRepresentable {
             nsView.stringValue = formatValue(value)
         }
 
-        // 更新主题（仅在非编辑时，避免干扰输入）
-        if !context.coordinator.isEditing {
+        // 更新主题（仅在主题切换后且非编辑时，避免干扰输入）
+        if !context.coordinator.isEditing && context.coordinator.appliedDarkMode != themeManager.isDarkMode {
+            context.coordinator.appliedDarkMode = themeManager.isDarkMode
             updateAppearance(nsView)
-        }
-
-        if !context.coordinator.isEditing {
             nsView.layer?.borderColor = NSColor(ThemeColors.borderNormal).cgColor
         }
     }
@@ -664,6 +649,8 @@ struct MaxSizeInputField: NSViewRepresentable {
     class Coordinator: NSObject, NSTextFieldDelegate {
         var parent: MaxSizeInputField
         var isEditing = false
+        /// 上次应用外观时的主题
+        var appliedDarkMode: Bool?
 
         init(_ parent: MaxSizeInputField) {
             self.parent = parent
@@ -743,6 +730,7 @@ struct ThemedDoubleField: NSViewRepresentable {
 
         // 初始值
         textField.stringValue = formatValue(value)
+        context.coordinator.appliedDarkMode = ThemeManager.shared.isDarkMode
 
         return textField
     }
@@ -753,11 +741,15 @@ struct ThemedDoubleField: NSViewRepresentable {
             nsView.stringValue = formatValue(value)
         }
 
-        // 更新主题颜色
-        nsView.backgroundColor = NSColor(ThemeColors.backgroundInput)
-        nsView.textColor = NSColor(ThemeColors.textPrimary)
-        if !context.coordinator.isEditing {
-            nsView.layer?.borderColor = NSColor(ThemeColors.borderNormal).cgColor
+        // 仅在主题切换后更新颜色
+        let isDarkMode = ThemeManager.shared.isDarkMode
+        if context.coordinator.appliedDarkMode != isDarkMode {
+            context.coordinator.appliedDarkMode = isDarkMode
+            nsView.backgroundColor = NSColor(ThemeColors.backgroundInput)
+            nsView.textColor = NSColor(ThemeColors.textPrimary)
+            if !context.coordinator.isEditing {
+                nsView.layer?.borderColor = NSColor(ThemeColors.borderNormal).cgColor
+            }
         }
     }
 
@@ -774,6 +766,8 @@ struct ThemedDoubleField: NSViewRepresentable {
     class Coordinator: NSObject, NSTextFieldDelegate {
         var parent: ThemedDoubleField
         var isEditing = false
+        /// 上次应用颜色时的主题
+        var appliedDarkMode: Bool?
 
         init(_ parent: ThemedDoubleField) {
             self.parent = parent
@@ -845,6 +839,7 @@ struct ThemedNSSlider: NSViewRepresentable {
 
         // 设置外观以适应深色/浅色模式
         updateSliderAppearance(slider)
+        context.coordinator.appliedDarkMode = themeManager.isDarkMode
         return slider
     }
 
@@ -853,7 +848,11 @@ struct ThemedNSSlider: NSViewRepresentable {
         if abs(nsView.doubleValue - value) > 0.5 {
             nsView.doubleValue = value
         }
-        updateSliderAppearance(nsView)
+        // 拖动时每次取值都会触发更新，外观只在主题切换后重设
+        if context.coordinator.appliedDarkMode != themeManager.isDarkMode {
+            context.coordinator.appliedDarkMode = themeManager.isDarkMode
+            updateSliderAppearance(nsView)
+        }
     }
 
     private func updateSliderAppearance(_ slider: NSSlider) {
@@ -871,6 +870,8 @@ struct ThemedNSSlider: NSViewRepresentable {
 
     class Coordinator: NSObject {
         var parent: ThemedNSSlider
+        /// 上次应用外观时的主题
+        var appliedDarkMode: Bool?
 
         init(_ parent: ThemedNSSlider) {
             self.parent = parent
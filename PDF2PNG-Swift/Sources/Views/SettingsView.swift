@@ -56,7 +56,7 @@ struct SettingsView: View {
                     Slider(
                         value: Binding(
                             get: { Double(appState.settings.maxDPI) },
-                            set: { appState.settings.maxDPI = Int($0) }
+                            set: { if Int($0) != appState.settings.maxDPI { appState.settings.maxDPI = Int($0) } }
                         ),
                         in: 150...2400,
                         step: 50
@@ -73,7 +73,7 @@ struct SettingsView: View {
                     Slider(
                         value: Binding(
                             get: { Double(appState.settings.minDPI) },
-                            set: { appState.settings.minDPI = Int($0) }
+                            set: { if Int($0) != appState.settings.minDPI { appState.settings.minDPI = Int($0) } }
                         ),
                         in: 72...Double(max(150, appState.settings.maxDPI - 50)),  // ✅ 修复：动态上限，确保 minDPI < maxDPI
                         step: 50
@@ -17,6 +17,24 @@ final class PDFConverterTests: XCTestCase {
         XCTAssertTrue(settings.qualityFirst)
     }
 
+    func testConversionSettingsLenientDecoding() throws {
+        // 缺失 maxDPI、sizeCalculationMode 无效：仅这两个字段回退默认值，其余保留
+        let json = Data("""
+        {"maxSizeMB": 8, "minDPI": 200, "qualityFirst": true, "sizeCalculationMode": "bogus"}
+        """.utf8)
+        let settings = try JSONDecoder().decode(ConversionSettings.self, from: json)
+        XCTAssertEqual(settings.maxSizeMB, 8)
+        XCTAssertEqual(settings.minDPI, 200)
+        XCTAssertEqual(settings.maxDPI, ConversionSettings.default.maxDPI)
+        XCTAssertTrue(settings.qualityFirst)
+        XCTAssertEqual(settings.sizeCalculationMode, ConversionSettings.default.sizeCalculationMode)
+        XCTAssertNil(settings.outputDirectory)
+
+        // 编码后再解码保持一致（确认编码与解码使用同一组键）
+        let roundTripped = try JSONDecoder().decode(ConversionSettings.self, from: JSONEncoder().encode(ConversionSettings.highQuality))
+        XCTAssertEqual(roundTripped, ConversionSettings.highQuality)
+    }
+
     func testTaskStatusProgress() {
         let pending = TaskStatus.pending
         XCTAssertEqual(pending.progress, 0)
@@ -29,7 +47,8 @@ final class PDFConverterTests: XCTestCase {
             minDPI: 600,
             maxDPI: 600,
             totalSizeBytes: 1000,
-            renderTimeMs: 100
+            renderTimeMs: 100,
+            pageSizes: []
         ))
         XCTAssertEqual(completed.progress, 1)
     }
@@ -39,4 +58,48 @@ final class PDFConverterTests: XCTestCase {
         XCTAssertEqual(ConversionSettings.DPIPreset.high.maxDPI, 1200)
         XCTAssertEqual(ConversionSettings.DPIPreset.ultra.maxDPI, 2400)
     }
+
+    func testCLIOptionsParsing() {
+        let options = CLIHandler.Options.parse([
+            "PDF2PNG", "--min-dpi", "700", "--max-dpi", "800",
+            "--output", "out.pdf", "input.pdf", "--quality-first", "Scan.PDF"
+        ])
+        XCTAssertFalse(options.showHelp)
+        XCTAssertEqual(options.pdfPaths, ["input.pdf", "Scan.PDF"])
+        XCTAssertEqual(options.settings.maxDPI, 800)
+        XCTAssertEqual(options.settings.minDPI, 700)
+        XCTAssertTrue(options.settings.qualityFirst)
+        XCTAssertEqual(options.settings.outputDirectory?.lastPathComponent, "out.pdf")
+    }
+
+    func testCLIDuplicateInputs() {
+        let options = CLIHandler.Options.parse(["PDF2PNG", "/tmp/a.pdf", "/tmp/./a.pdf", "/tmp/b.pdf"])
+        XCTAssertEqual(options.pdfPaths, ["/tmp/a.pdf", "/tmp/b.pdf"])
+
+        // 不同目录下的同名文件在指定 --output 时输出冲突，归为同一批依次转换
+        let urls = ["/x/report.pdf", "/y/Report.PDF", "/x/other.pdf"].map { URL(fileURLWithPath: $0) }
+        let shared = CLIHandler.outputBatches(for: urls, outputDirectory: URL(fileURLWithPath: "/out"))
+        XCTAssertEqual(shared.map(\.count), [2, 1])
+        let separate = CLIHandler.outputBatches(for: urls, outputDirectory: nil)
+        XCTAssertEqual(separate.map(\.count), [1, 1, 1])
+    }
+
+    func testCLIInvocationDetection() {
+        XCTAssertTrue(CLIHandler.isCLIInvocation(["PDF2PNG", "test.pdf"]))
+        XCTAssertTrue(CLIHandler.isCLIInvocation(["PDF2PNG", "Scan.PDF"]))
+        XCTAssertTrue(CLIHandler.isCLIInvocation(["PDF2PNG", "--help"]))
+        XCTAssertFalse(CLIHandler.isCLIInvocation(["PDF2PNG"]))
+        XCTAssertFalse(CLIHandler.isCLIInvocation(["PDF2PNG", "-NSDocumentRevisionsDebugMode", "YES"]))
+    }
+
+    func testInterpolatedDPI() {
+        // size ∝ dpi²：目标大小对应 DPI 150
+        let dpi = PDFConverter.interpolatedDPI(low: 100, lowSize: 10_000, high: 200, highSize: 40_000, target: 22_500)
+        XCTAssertTrue((149...150).contains(dpi))
+        // 结果始终落在开区间内
+        XCTAssertEqual(PDFConverter.interpolatedDPI(low: 100, lowSize: 10_000, high: 200, highSize: 40_000, target: 1_000_000), 199)
+        XCTAssertEqual(PDFConverter.interpolatedDPI(low: 100, lowSize: 10_000, high: 200, highSize: 40_000, target: 1), 101)
+        // 样本无效时退回二分
+        XCTAssertEqual(PDFConverter.interpolatedDPI(low: 100, lowSize: 10_000, high: 200, highSize: 10_000, target: 5_000), 150)
+    }
 }